@@ -9,6 +9,9 @@ import dash as _dash
 # noinspection PyUnresolvedReferences
 from ._imports_ import *
 from ._imports_ import __all__
+from ._fast import install as _install_fast_paths
+
+_install_fast_paths(DashReactGrid)
 
 if not hasattr(_dash, '__plotly_dash') and not hasattr(_dash, 'development'):
     print('Dash was not successfully imported. '
@@ -0,0 +1,91 @@
+"""Hand-written fast paths for the generated DashReactGrid component.
+
+DashReactGrid.py is rewritten by ``npm run build:backends``, so these
+live here and are attached to the class from ``__init__.py``.
+"""
+import inspect
+
+from dash.development.base_component import Component
+
+_UNDEF = Component.UNDEFINED
+_REQ = Component.REQUIRED
+
+
+def to_plotly_json(self):
+    # pylint: disable=protected-access  # attached to the class as a method
+    # There are no wildcard (data-*/aria-*) props, so skip the base
+    # class's scan of the instance __dict__ for them.
+    props = {}
+    for p in self._prop_names:
+        v = getattr(self, p, _UNDEF)
+        if v is not _UNDEF:
+            props[p] = v
+    return {'props': props, 'type': self._type, 'namespace': self._namespace}
+
+
+def _generated_props(cls, params):
+    # Run the generated __init__ once, so the prop lists come from the
+    # generator output rather than a copy of it.
+    return cls(**{p.name: None for p in params if p.default is _REQ})
+
+
+def _build_init(cls, params, prop_names):
+    # Same signature as the generated __init__, but without the
+    # _explicitize_args wrapper, locals() snapshot or per-call prop lists:
+    # each optional prop is a single sentinel check.
+    named = params[1:-1]
+    kwargs = params[-1].name
+    defaults = {p.name: '_REQ' if p.default is _REQ else '_UNDEF' for p in named}
+    signature = ', '.join(f'{name}={default}' for name, default in defaults.items())
+    lines = [f'def __init__(self, {signature}, **{kwargs}):']
+    # Checked in the same order as the generated code, which follows the props
+    for name in prop_names:
+        if defaults.get(name) == '_REQ':
+            lines.append(f'    if {name} is _REQ:')
+            lines.append(f"        raise TypeError('Required argument `{name}` was not specified.')")
+    # Excess named props stay in kwargs; Component.__init__ rejects them
+    for name, default in defaults.items():
+        if default == '_UNDEF':
+            lines.append(f'    if {name} is not _UNDEF:')
+            lines.append(f'        {kwargs}[{name!r}] = {name}')
+        else:
+            lines.append(f'    {kwargs}[{name!r}] = {name}')
+    lines.append(f'    super(_cls, self).__init__(**{kwargs})')
+
+    namespace = {'_UNDEF': _UNDEF, '_REQ': _REQ, '_cls': cls, '__name__': __name__}
+    exec('\n'.join(lines), namespace)  # pylint: disable=exec-used
+    init = namespace['__init__']
+    init.__qualname__ = cls.__qualname__ + '.__init__'
+    init.__doc__ = cls.__init__.__doc__
+    return init
+
+
+def install(cls):
+    """Replace ``cls.__init__`` and ``cls.to_plotly_json`` with fast paths.
+
+    The generated code is kept when its ``__init__`` is not the plain
+    shape handled here, or when the component declares wildcard props.
+    """
+    # pylint: disable=protected-access  # the generated prop lists are private
+    params = list(inspect.signature(cls.__init__).parameters.values())
+    kinds = [p.kind for p in params]
+    if (len(params) < 3 or kinds[-1] is not inspect.Parameter.VAR_KEYWORD
+            or any(k is not inspect.Parameter.POSITIONAL_OR_KEYWORD for k in kinds[:-1])
+            or any(p.default not in (_UNDEF, _REQ) for p in params[1:-1])):
+        return False
+
+    probe = _generated_props(cls, params)
+    if probe._valid_wildcard_attributes or probe.available_wildcard_properties:
+        return False
+
+    cls.__init__ = _build_init(cls, params, probe._prop_names)
+    to_plotly_json.__qualname__ = cls.__qualname__ + '.to_plotly_json'
+    cls.to_plotly_json = to_plotly_json
+    # Shared by every instance instead of rebuilt by the generated __init__
+    prop_names = tuple(probe._prop_names)
+    cls._prop_names = prop_names
+    cls._valid_wildcard_attributes = ()
+    cls.available_properties = (prop_names if probe.available_properties == probe._prop_names
+                                else tuple(probe.available_properties))
+    cls.available_wildcard_properties = ()
+    return True
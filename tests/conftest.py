@@ -0,0 +1,35 @@
+import logging
+
+
+# dash_duo starts the app without debug, so Dash leaves werkzeug's
+# per-request access log on; nothing in the tests reads it.
+logging.getLogger("werkzeug").setLevel(logging.ERROR)
+
+
+class ChromeOptionsPlugin:  # pylint: disable=too-few-public-methods  # a pytest plugin
+    """Registered by pytest_configure only when the webdriver is Chrome."""
+
+    # Picked up by dash.testing when it builds the dash_duo webdriver.
+    @staticmethod
+    def pytest_setup_options():
+        # Only needed for Chrome runs, so -m "not e2e" works without selenium.
+        from selenium.webdriver.chrome.options import Options  # pylint: disable=import-outside-toplevel
+
+        # The tests only assert on grid DOM state, so skip images and
+        # extensions to cut Chrome startup and render time.
+        options = Options()
+        options.add_argument("--blink-settings=imagesEnabled=false")
+        options.add_argument("--disable-extensions")
+        return options
+
+
+def pytest_configure(config):
+    # The browser options only exist when dash[testing] is installed.
+    option = config.option
+    # Run headless through dash.testing's own flag, unless --pause asks
+    # for a browser to debug in.
+    if hasattr(option, "headless") and not getattr(option, "pause", False):
+        option.headless = True
+    # Other browsers (e.g. --webdriver Firefox) keep dash.testing's defaults.
+    if getattr(option, "webdriver", None) == "Chrome":
+        config.pluginmanager.register(ChromeOptionsPlugin())
@@ -0,0 +1,60 @@
+import importlib.util
+import os
+
+import pytest
+
+import dash_reactgrid
+from dash_reactgrid import DashReactGrid, _fast
+
+
+def _load_generated():
+    # A second, untouched copy of the generator output to compare against.
+    path = os.path.join(os.path.dirname(dash_reactgrid.__file__), 'DashReactGrid.py')
+    spec = importlib.util.spec_from_file_location('_generated_dash_reactgrid', path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module.DashReactGrid
+
+
+Generated = _load_generated()
+
+CASES = [
+    ((), {'id': 'g', 'columns': [{'columnId': 'a'}], 'data': [[1]], 'stickyTopRows': 1}),
+    (('g', [{'columnId': 'a'}], [[1]]), {'style': {'height': 100}}),
+    (('g', [], []), {'highlights': None, 'className': None}),
+    ((), {'columns': None, 'data': None, 'style': None}),
+    ((), {'columns': [], 'data': []}),
+]
+
+BAD_CASES = [
+    ((), {'data': []}),
+    ((), {'columns': []}),
+    ((), {}),
+    ((), {'columns': [], 'data': [], 'foo': 1}),
+    ((), {'columns': [], 'data': [], 'data-x': 1}),
+    ((), {'id': None, 'columns': [], 'data': []}),
+]
+
+
+def test_fast_path_installed():
+    # Fails if a regenerated DashReactGrid.py no longer matches install()
+    assert DashReactGrid.__init__.__module__ == _fast.__name__
+    assert DashReactGrid.to_plotly_json is _fast.to_plotly_json
+    assert Generated.__init__.__module__ != _fast.__name__
+
+
+@pytest.mark.parametrize('args, kwargs', CASES)
+def test_matches_generated(args, kwargs):
+    fast = DashReactGrid(*args, **kwargs)
+    generated = Generated(*args, **kwargs)
+    assert fast.to_plotly_json() == generated.to_plotly_json()
+    assert repr(fast) == repr(generated)
+
+
+@pytest.mark.parametrize('args, kwargs', BAD_CASES)
+def test_errors_match_generated(args, kwargs):
+    with pytest.raises(TypeError) as generated:
+        Generated(*args, **kwargs)
+    with pytest.raises(TypeError) as fast:
+        DashReactGrid(*args, **kwargs)
+    assert str(fast.value) == str(generated.value)
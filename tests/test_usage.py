@@ -1,8 +1,10 @@
+import pytest
 from dash.testing.application_runners import import_app
 
 
 # Basic test for the component rendering.
 # The dash_duo pytest fixture is installed with dash (v1.0+)
+@pytest.mark.e2e
 def test_render_component(dash_duo):
     # Start a dash app contained as the variable `app` in `usage.py`
     app = import_app('usage')
@@ -8,9 +8,9 @@ columns = [
     {"columnId": "surname", "title": "Surname", "type": "text"},
     {"columnId": "age", "title": "Age", "type": "number", "align": "right"},
 ]
-data = [["Matthew", "Norman", (9)], ["James", "Norman", (44)]] + [
-    ["James", "Norman", 1234]
-] * 100
+data = [["Matthew", "Norman", 9], ["James", "Norman", 44]] + [
+    ["James", "Norman", 1234] for _ in range(100)
+]
 
 highlights = [
     {"columnId": "surname", "rowId": 2, "borderColor": "green", "className": "test"}
@@ -22,7 +22,7 @@ app.layout = html.Div(
             id="input",
             columns=columns,
             data=data,
-            # styleHeader = {"font-weight":100},
+            # styleHeader = {"fontWeight": 100},
             style={
                 "height": "50vh",
                 "overflowY": "scroll",
@@ -41,7 +41,8 @@ app.layout = html.Div(
 
 
 def isempty(cell):
-    return True if cell is None or cell == "" or cell == float("nan") else False
+    # NaN never compares equal to anything, itself included.
+    return cell is None or cell == "" or cell != cell
 
 
 # @callback(Output("input", "data"), Input("input", "data"))
@@ -49,8 +50,11 @@ def new_row(data):
     if not isempty(data[-1][0]):
         data.append([None] * len(columns))
     else:
-        while len(data) > 1 and isempty(data[-2][0]):
-            data.pop()
+        # Trim the trailing run of empty rows down to one in a single slice.
+        end = len(data) - 1
+        while end > 0 and isempty(data[end - 1][0]):
+            end -= 1
+        del data[end + 1 :]
 
     return data
 
@@ -1,32 +1,41 @@
 import dash_reactgrid as drg
-from dash import Dash, callback, html, Input, Output, State, dcc
+from dash import Dash, callback, html, Input, Output, State, dcc, no_update
 
 app = Dash(__name__)
 
 target_terms = [i for i in range(10)]
+time_column = {"columnId":"time","title":"Time","align":"left","type":"number"}
+# Shared by every rate column; only columnId and title vary per term
+rate_column = {"align":"right","type":"percent","formatOptions":{"maximumFractionDigits":3},"headerStyle":{"writingMode":"vertical-rl"}}
 def create_columns(terms):
-    columns = [{"columnId":"time","title":"Time","align":"left","type":"number"}]+[{"columnId":str(term),"title":str(term)+ " Year Rate","align":"right","type":"percent","formatOptions":{"maximumFractionDigits":3},"headerStyle":{"writingMode":"vertical-rl"}} for term in terms]
+    columns = [time_column]+[{"columnId":str(term),"title":str(term)+ " Year Rate",**rate_column} for term in terms]
     return columns
 
 columns = create_columns(target_terms)
-data = [[3]*(len(target_terms)+1)]*10
+data = [[3]*(len(target_terms)+1) for _ in range(10)]
 
 highlights = [{"columnId":1,"rowId":2,"borderColor":"red","className":"topleft"},{"columnId":2,"rowId":2,"className":"topright"},{"columnId":1,"rowId":3,"className":"bottomleft"},{"columnId":2,"rowId":3,"className":"bottomright"}]
 
 
-app.layout = html.Div([
-    dcc.Input(id="terms",value=3),
-    html.Div(id="grid-container",children=drg.DashReactGrid(
+def create_grid():
+    return drg.DashReactGrid(
         id='input',
         columns=columns,
         data = data,
         enableFillHandle=True,
         highlights=highlights,
-        styleHeader = {"font-weight":100,"height":100},
+        styleHeader = {"fontWeight":100,"height":100},
         style = {"height":"50vh","overflowY":"scroll",
-                 "font-family": "Arial, Helvetica, sans-serif"},   
-                ),
-                style={"display":"none"}),
+                 "fontFamily": "Arial, Helvetica, sans-serif"},   
+                )
+
+
+app.layout = html.Div([
+    dcc.Input(id="terms",value=3),
+    # The grid starts hidden, so it is only mounted by toggle_hide on first show
+    html.Div(id="grid-container",style={"display":"none"}),
+    # Set once the grid is mounted, so toggling doesn't send the grid back to the server
+    dcc.Store(id="grid-mounted",data=False),
         
     html.Div(id='output'),html.Div(id='output2'),html.Button("Hide/Unhide",id="hide"),
 ])
@@ -50,13 +59,16 @@ app.layout = html.Div([
 #    terms_list = [term for term in range(1,terms+1)]
 #    return create_columns(terms_list)
 
-@app.callback(Output("grid-container","style"),Input("hide","n_clicks"),State("grid-container","style"))
-def toggle_hide(n_clicks,style):
+@app.callback(Output("grid-container","style"),Output("grid-container","children"),Output("grid-mounted","data"),Input("hide","n_clicks"),State("grid-container","style"),State("grid-mounted","data"))
+def toggle_hide(n_clicks,style,mounted):
     if not n_clicks:
-        return style
+        return style,no_update,no_update
     if style["display"]=="none":
-        return {"display":"block"}
-    return {"display":"none"}
+        # Later shows keep the already mounted grid (and any edits made to it)
+        if mounted:
+            return {"display":"block"},no_update,no_update
+        return {"display":"block"},create_grid(),True
+    return {"display":"none"},no_update,no_update
 
 #@app.callback(Output("input","columns"),Input("hide","n_clicks"),State("input","columns"))
 #def toggle_hide(n,columns):
@@ -65,4 +77,5 @@ def toggle_hide(n_clicks,style):
 
 flask_app = app.server
 
-flask_app.run(debug=True, port=5000)
+if __name__ == "__main__":
+    flask_app.run(debug=True, port=5000)